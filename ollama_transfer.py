@@ -1,10 +1,20 @@
 
 #!/usr/bin/env python3
+import argparse
+import functools
+import hashlib
 import json
+import re
 import subprocess
+import sys
 import os
 import shutil
 import platform
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from operator import itemgetter
 from pathlib import Path
 
 
@@ -20,31 +30,59 @@ try:
 except ImportError:
     LISTPICK_AVAILABLE = False
 
-OUTPUT_DIR = Path("./ollama")
+try:
+    import fcntl
+    FCNTL_AVAILABLE = True
+except ImportError:  # Windows
+    FCNTL_AVAILABLE = False
 
-# Set OLLAMA_BASE_DIR based on operating system
-system = platform.system()
-if system == "Darwin":  # macOS
-    OLLAMA_BASE_DIR = Path.home() / ".ollama/models"
-elif system == "Windows":
-    OLLAMA_BASE_DIR = Path.home() / ".ollama/models"
-else:  # Linux and others
-    # Check if /var/lib/ollama/models exists, otherwise use /usr/share/ollama/.ollama
-    if (Path("/var/lib/ollama") / "blobs").exists():
-        OLLAMA_BASE_DIR = Path("/var/lib/ollama")
-    elif (Path("/var/lib/ollama/models") / "blobs").exists():
-        OLLAMA_BASE_DIR = Path("/var/lib/ollama")
-    else:
-        OLLAMA_BASE_DIR = Path("/usr/share/ollama/models")
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
+OUTPUT_DIR = Path("./ollama")
 if CUSTOM_OUTPUT_DIR != "":
     OUTPUT_DIR = Path(CUSTOM_OUTPUT_DIR)
-if CUSTOM_OLLAMA_BASE_DIR != "":
-    OLLAMA_BASE_DIR = Path(CUSTOM_OLLAMA_BASE_DIR)
 
+@functools.lru_cache(maxsize=None)
+def _resolve_ollama_base_dir():
+    """Return the Ollama base directory, guessed from the operating system on first use.
+
+    Set CUSTOM_OLLAMA_BASE_DIR to override it; the module no longer exposes
+    OLLAMA_BASE_DIR/OLLAMA_MANIFEST_DIR/OLLAMA_BLOB_DIR as variables.
+    """
+    if CUSTOM_OLLAMA_BASE_DIR != "":
+        return Path(CUSTOM_OLLAMA_BASE_DIR)
+
+    system = platform.system()
+    if system == "Darwin":  # macOS
+        return Path.home() / ".ollama/models"
+    elif system == "Windows":
+        return Path.home() / ".ollama/models"
+    else:  # Linux and others
+        # Check if /var/lib/ollama/models exists, otherwise use /usr/share/ollama/.ollama
+        if os.path.isdir("/var/lib/ollama/blobs"):
+            return Path("/var/lib/ollama")
+        elif os.path.isdir("/var/lib/ollama/models/blobs"):
+            return Path("/var/lib/ollama")
+        else:
+            return Path("/usr/share/ollama/models")
+
+def ollama_base_dir():
+    """Return the Ollama models directory."""
+    return _resolve_ollama_base_dir()
 
-OLLAMA_MANIFEST_DIR = OLLAMA_BASE_DIR / "manifests/registry.ollama.ai/library"
-OLLAMA_BLOB_DIR = OLLAMA_BASE_DIR / "blobs"
+def ollama_manifest_dir():
+    """Return the directory holding the library model manifests."""
+    return _resolve_ollama_base_dir() / "manifests/registry.ollama.ai/library"
+
+def ollama_blob_dir():
+    """Return the directory holding the model blobs."""
+    return _resolve_ollama_base_dir() / "blobs"
+
+_LIST_LINE_RE = re.compile(r"^(\S+)\s+(\S+)\s+(\S+\s+\S+)(?:\s+(.*?))?\s*$")
 
 def get_installed_models():
     """Run `ollama list` and return a list of model details."""
@@ -58,20 +96,20 @@ def get_installed_models():
         exit(1)
 
     lines = result.stdout.strip().splitlines()
-    models = []
+    keyed = []
     for line in lines[1:]:  # Skip header
-        parts = line.split()
-        if len(parts) >= 4:
+        match = _LIST_LINE_RE.match(line)
+        if match:
             # NAME, ID, SIZE (e.g., "5.2 GB"), MODIFIED (e.g., "2 months ago")
-            name = parts[0]
-            id_ = parts[1]
-            size = parts[2] + " " + parts[3]
-            modified = " ".join(parts[4:])
-            models.append([name, id_, size, modified])
+            name, id_, size, modified = match.groups()
+            keyed.append((name.lower(), [name, id_, size, modified or ""]))
 
     # Sort alphabetically by name
-    models.sort(key=lambda x: x[0].lower())
-    return models
+    keyed.sort(key=itemgetter(0))
+    return [model for _, model in keyed]
+
+_CHOICE_RE = re.compile(r"^\s*\d+(?:\s*,\s*\d+)*\s*$")
+_NUMBER_RE = re.compile(r"\d+")
 
 def choose_models_text(models):
     """Text-based model selection for Windows (fallback when listpick isn't available)."""
@@ -82,31 +120,28 @@ def choose_models_text(models):
         name, id_, size, modified = model
         print(f"{i:<4} {name:<30} {id_:<15} {size:<10} {modified:<15}")
 
+    valid = set(range(1, len(models) + 1))
     while True:
-        try:
-            choice_input = input("\nSelect model number(s) (comma-separated for multiple, 'all' for all models, or press Enter to cancel): ").strip()
-            if not choice_input:
-                return []
-
-            # Check if user wants all models
-            if choice_input.lower() == "all":
-                return [model[0] for model in models]
-
-            choices = [int(c.strip()) for c in choice_input.split(",")]
-            selected_models = []
-
-            for choice in choices:
-                if 1 <= choice <= len(models):
-                    selected_models.append(models[choice - 1][0])  # Return just the name
-                else:
-                    print(f"Invalid choice: {choice}. Try again.")
-                    break
-            else:
-                # All choices were valid
-                if selected_models:
-                    return selected_models
-        except ValueError:
+        choice_input = input("\nSelect model number(s) (comma-separated for multiple, 'all' for all models, or press Enter to cancel): ").strip()
+        if not choice_input:
+            return []
+
+        # Check if user wants all models
+        if choice_input.lower() == "all":
+            return [model[0] for model in models]
+
+        if not _CHOICE_RE.match(choice_input):
             print("Please enter valid number(s) or 'all'.")
+            continue
+
+        choices = set(map(int, _NUMBER_RE.findall(choice_input)))
+        invalid = choices - valid
+        if invalid:
+            print(f"Invalid choice(s): {', '.join(map(str, sorted(invalid)))}. Try again.")
+            continue
+
+        # Return just the names
+        return [models[i - 1][0] for i in sorted(choices)]
 
 def choose_models_picker(stdscr, models):
     """Interactive picker-based model selection for macOS/Linux."""
@@ -132,16 +167,35 @@ def choose_models_picker(stdscr, models):
 def find_manifest_path(model_name):
     """Return the full path to the manifest file for a model."""
     model_name, model_version = str(model_name).split(":")
-    manifest_path = OLLAMA_MANIFEST_DIR / model_name / model_version
-    if not manifest_path.exists():
+    manifest_path = ollama_manifest_dir() / model_name / model_version
+    if not os.path.exists(manifest_path):
         print(f"Manifest not found for model: {model_name}")
         exit(1)
     return manifest_path
 
+MANIFEST_READ_SIZE = 1 << 16  # manifests are a few KiB, so usually one read
+
+def _read_file(path):
+    """Return the bytes of a small file, read without Python's buffered I/O layers."""
+    fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        chunks = []
+        while True:
+            chunk = os.read(fd, MANIFEST_READ_SIZE)
+            if not chunk:
+                break
+            chunks.append(chunk)
+    finally:
+        os.close(fd)
+    return b"".join(chunks)
+
+def _decode_json(data):
+    """Decode JSON bytes, with orjson when it is installed."""
+    return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+
 def parse_manifest(manifest_path):
     """Parse manifest JSON and return all digests."""
-    with open(manifest_path, "r") as f:
-        manifest = json.load(f)
+    manifest = _decode_json(_read_file(manifest_path))
 
     digests = []
     config_digest = manifest.get("config", {}).get("digest")
@@ -153,6 +207,89 @@ def parse_manifest(manifest_path):
             digests.append(layer["digest"])
     return digests
 
+def _human_size(size):
+    """Format a byte count the way `ollama list` does (e.g. "4.7 GB", "274 MB")."""
+    for unit, scale in (("TB", 1000 ** 4), ("GB", 1000 ** 3), ("MB", 1000 ** 2), ("KB", 1000)):
+        if size >= scale:
+            value = size / scale
+            if value >= 10 or value == int(value):
+                return f"{int(value)} {unit}"
+            return f"{value:.1f} {unit}"
+    return f"{size} B"
+
+def _human_duration(seconds):
+    """Format a duration like Ollama's format.HumanDuration (e.g. "About an hour")."""
+    if seconds < 1:
+        return "Less than a second"
+    if seconds < 2:
+        return "1 second"
+    if seconds < 60:
+        return f"{int(seconds)} seconds"
+    minutes = int(seconds // 60)
+    if minutes == 1:
+        return "About a minute"
+    if minutes < 60:
+        return f"{minutes} minutes"
+    hours = int(seconds / 3600 + 0.5)  # Go's math.Round: halves round up
+    if hours == 1:
+        return "About an hour"
+    if hours < 48:
+        return f"{hours} hours"
+    if hours < 24 * 7 * 2:
+        return f"{hours // 24} days"
+    if hours < 24 * 30 * 2:
+        return f"{hours // (24 * 7)} weeks"
+    if hours < 24 * 365 * 2:
+        return f"{hours // (24 * 30)} months"
+    return f"{int(seconds // 3600) // (24 * 365)} years"
+
+def _time_ago(timestamp, now=None):
+    """Format a timestamp the way `ollama list` does (e.g. "2 months ago")."""
+    delta = (time.time() if now is None else now) - timestamp
+    if delta < 0:
+        return f"{_human_duration(-delta)} from now"
+    return f"{_human_duration(delta)} ago"
+
+def scan_local_models():
+    """Return model details like get_installed_models(), read from the manifests on disk."""
+    keyed = []
+    try:
+        model_dirs = list(os.scandir(ollama_manifest_dir()))
+    except OSError:
+        return []
+    for model_dir in model_dirs:
+        if not model_dir.is_dir():
+            continue
+        try:
+            versions = list(os.scandir(model_dir.path))
+        except OSError:
+            continue
+        for version in versions:
+            if not version.is_file():
+                continue
+            try:
+                data = _read_file(version.path)
+                manifest = _decode_json(data)
+                modified = version.stat().st_mtime
+            except (OSError, ValueError):
+                continue
+            # The manifest lists every blob's size, so no need to stat the blobs
+            size = manifest.get("config", {}).get("size", 0)
+            size += sum(layer.get("size", 0) for layer in manifest.get("layers", []))
+            name = f"{model_dir.name}:{version.name}"
+            # `ollama list` shows the first 12 hex digits of the manifest's sha256 as the ID
+            id_ = hashlib.sha256(data).hexdigest()[:12]
+            keyed.append((name.lower(), [name, id_, _human_size(size), _time_ago(modified)]))
+
+    # Sort alphabetically by name
+    keyed.sort(key=itemgetter(0))
+    return [model for _, model in keyed]
+
+def load_model(model_name):
+    """Return (model_name, manifest_path, digests) for a model."""
+    manifest_path = find_manifest_path(model_name)
+    return model_name, manifest_path, parse_manifest(manifest_path)
+
 def prompt_copy():
     """Ask the user if they want to copy the files."""
     while True:
@@ -164,8 +301,230 @@ def prompt_copy():
         else:
             print("Please enter 'y' or 'n'.")
 
-def copy_files(model_name, manifest_path, digests):
-    """Copy manifest and blobs to ./ollama/ directory structure."""
+COPY_BUFFER_SIZE = 1 << 20  # 1 MiB
+
+KERNEL_COPY_CHUNK = 1 << 30  # upper bound per copy_file_range/sendfile call
+MAX_COPY_WORKERS = 8
+MAX_MANIFEST_WORKERS = 8
+FICLONE = 0x40049409  # Linux ioctl: reflink a whole file (btrfs, xfs)
+
+_buffers = threading.local()
+
+def _thread_buffers():
+    """Return the pair of copy buffers reused by every copy on the calling thread."""
+    bufs = getattr(_buffers, "bufs", None)
+    if bufs is None:
+        bufs = _buffers.bufs = (bytearray(COPY_BUFFER_SIZE), bytearray(COPY_BUFFER_SIZE))
+    return bufs
+
+def _read_ahead(fsrc, bufs, free, filled):
+    """Reader side of _copy_stream: fill whichever buffer the writer has released."""
+    try:
+        while True:
+            idx = free.get()
+            if idx is None:  # writer gave up
+                return
+            n = fsrc.readinto(bufs[idx])
+            filled.put((idx, n))
+            if not n:
+                return
+    except Exception as e:
+        filled.put((None, e))
+
+def _copy_stream(fsrc, fdst, bufs):
+    """Copy the rest of fsrc to fdst, double-buffered.
+
+    A reader thread fills one buffer while this thread writes the other, so
+    the source and destination are busy at the same time.
+    """
+    views = [memoryview(buf) for buf in bufs]
+    free, filled = queue.Queue(), queue.Queue()
+    for idx in range(len(bufs)):
+        free.put(idx)
+    reader = threading.Thread(target=_read_ahead, args=(fsrc, bufs, free, filled), daemon=True)
+    reader.start()
+    try:
+        while True:
+            idx, n = filled.get()
+            if idx is None:
+                raise n
+            if not n:
+                break
+            written = 0
+            while written < n:  # unbuffered writes may be short
+                written += fdst.write(views[idx][written:n])
+            free.put(idx)
+    finally:
+        free.put(None)
+        reader.join()
+
+def _kernel_copies():
+    """Return the in-kernel copy primitives available on this platform, fastest first."""
+    copies = []
+    if hasattr(os, "copy_file_range"):  # Linux >= 4.5, may reflink on CoW filesystems
+        copies.append(lambda src_fd, dst_fd, count: os.copy_file_range(src_fd, dst_fd, count))
+    if hasattr(os, "sendfile") and sys.platform.startswith("linux"):
+        # Elsewhere (macOS, BSD) sendfile only writes to sockets and takes an int offset
+        copies.append(lambda src_fd, dst_fd, count: os.sendfile(dst_fd, src_fd, None, count))
+    return copies
+
+_KERNEL_COPIES = _kernel_copies()
+
+# Platform checks used by the copy workers, computed once rather than per blob
+_IS_LINUX = sys.platform.startswith("linux")
+_IS_WINDOWS = os.name == "nt"
+
+def _fadvise(fd, offset, length, advice):
+    """Give the kernel an access-pattern hint for fd; a no-op where unsupported."""
+    if hasattr(os, "posix_fadvise"):
+        try:
+            os.posix_fadvise(fd, offset, length, getattr(os, advice))
+        except OSError:
+            pass
+
+COPY_FILE_NO_BUFFERING = 0x1000  # CopyFileExW flag: bypass the Windows file cache
+NO_BUFFERING_THRESHOLD = 1 << 30  # only worth it for large files
+
+@functools.lru_cache(maxsize=None)
+def _copy_file_ex_w():
+    """Return kernel32.CopyFileExW with its signature declared (Windows only)."""
+    import ctypes  # only needed on Windows; keep it out of import time
+    copy_file_ex_w = ctypes.WinDLL("kernel32", use_last_error=True).CopyFileExW
+    copy_file_ex_w.argtypes = [ctypes.c_wchar_p, ctypes.c_wchar_p, ctypes.c_void_p,
+                               ctypes.c_void_p, ctypes.c_void_p, ctypes.c_uint32]
+    copy_file_ex_w.restype = ctypes.c_int
+    return copy_file_ex_w
+
+def _windows_copy(src, dst):
+    """Copy src to dst with CopyFileExW; return False if it fails."""
+    try:
+        flags = COPY_FILE_NO_BUFFERING if os.stat(src).st_size >= NO_BUFFERING_THRESHOLD else 0
+        return bool(_copy_file_ex_w()(str(src), str(dst), None, None, None, flags))
+    except (OSError, AttributeError):
+        return False
+
+def _fast_copy(src, dst):
+    """Copy src to dst, keeping the data in the kernel where possible.
+
+    On Windows this uses CopyFileExW. Elsewhere (or if that fails) it tries
+    copy_file_range, then sendfile, then a double-buffered userspace loop. Each
+    method continues from the current file offsets, so a fallback after a
+    partial copy picks up where the previous one stopped.
+    """
+    if _IS_WINDOWS and _windows_copy(src, dst):
+        return
+
+    with open(src, "rb", buffering=0) as fsrc, open(dst, "wb", buffering=0) as fdst:
+        src_fd, dst_fd = fsrc.fileno(), fdst.fileno()
+        size = os.fstat(src_fd).st_size
+        # Read the source sequentially with aggressive readahead, then drop it
+        # from the page cache so one large blob doesn't evict everything else
+        _fadvise(src_fd, 0, 0, "POSIX_FADV_SEQUENTIAL")
+        _fadvise(src_fd, 0, size, "POSIX_FADV_WILLNEED")
+        try:
+            remaining = size
+            for kernel_copy in _KERNEL_COPIES:
+                try:
+                    while remaining > 0:
+                        n = kernel_copy(src_fd, dst_fd, min(remaining, KERNEL_COPY_CHUNK))
+                        if n == 0:
+                            break
+                        remaining -= n
+                except OSError:
+                    continue
+                if remaining <= 0:
+                    return
+            _copy_stream(fsrc, fdst, _thread_buffers())
+        finally:
+            _fadvise(src_fd, 0, 0, "POSIX_FADV_DONTNEED")
+
+def list_blob_names():
+    """Return the set of file names in the Ollama blobs directory (one directory read)."""
+    try:
+        with os.scandir(ollama_blob_dir()) as entries:
+            return {entry.name for entry in entries}
+    except FileNotFoundError:
+        return set()
+
+def _link(src, dst):
+    """Hardlink src to dst. Return False if that is not possible."""
+    try:
+        os.link(src, dst)
+        return True
+    except FileExistsError:
+        # Fine if an earlier export already linked it; otherwise dst gets replaced
+        try:
+            return os.path.samefile(src, dst)
+        except OSError:
+            return False
+    except OSError:
+        return False
+
+def _clone(src, dst):
+    """Reflink src into the new file dst. Return False if that is not possible."""
+    if not (FCNTL_AVAILABLE and _IS_LINUX):
+        return False
+    try:
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+        return True
+    except OSError:
+        return False
+
+def _export_blob(src, dst, link):
+    """Link the blob into place when allowed and possible, otherwise copy it.
+
+    Data is written to a temporary file beside dst and renamed over it, so an
+    existing dst is never truncated in place (it may be a hardlink to src).
+    """
+    if link and _link(src, dst):
+        return
+    tmp = f"{dst}.{os.getpid()}-{threading.get_ident()}.tmp"
+    try:
+        if not (link and _clone(src, tmp)):
+            _fast_copy(src, tmp)
+        os.replace(tmp, dst)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+def _same_size(src, dst):
+    """Return True if dst exists and is the same size as src."""
+    try:
+        return os.stat(dst).st_size == os.stat(src).st_size
+    except FileNotFoundError:
+        return False
+
+def output_dirs(model_base):
+    """Return the (manifest_dir, blobs_dir) a model is exported into."""
+    return OUTPUT_DIR / "manifests" / "registry.ollama.ai" / "library" / model_base, OUTPUT_DIR / "blobs"
+
+def make_output_dirs(model_names):
+    """Create the output directories for all models once; return the ones created."""
+    wanted = set()
+    for model_name in model_names:
+        wanted.update(output_dirs(model_name.split(":")[0]))
+
+    created = set()
+    for directory in wanted:
+        try:
+            directory.mkdir(parents=True, exist_ok=True)
+            created.add(directory)
+        except OSError:
+            pass  # copy_files() retries and reports the error
+    return created
+
+def copy_files(model_name, manifest_path, digests, blob_names=None, link=True, dirs_created=None):
+    """Copy manifest and blobs to ./ollama/ directory structure.
+
+    blob_names is the result of list_blob_names(); when omitted each blob is
+    checked on disk. With link=True, blobs are hardlinked or reflinked instead
+    of copied when the output directory is on the same filesystem. Directories
+    in dirs_created (from make_output_dirs()) are assumed to exist.
+    """
     # Parse model name and version
     model_parts = model_name.split(":")
     if len(model_parts) != 2:
@@ -175,12 +534,13 @@ def copy_files(model_name, manifest_path, digests):
     model_base, version = model_parts
 
     # Create directory structure
-    manifest_dir = OUTPUT_DIR / "manifests" / "registry.ollama.ai" / "library" / model_base
-    blobs_dir = OUTPUT_DIR / "blobs"
+    manifest_dir, blobs_dir = output_dirs(model_base)
+    dirs_created = dirs_created or set()
 
     try:
-        manifest_dir.mkdir(parents=True, exist_ok=True)
-        blobs_dir.mkdir(parents=True, exist_ok=True)
+        for directory in (manifest_dir, blobs_dir):
+            if directory not in dirs_created:
+                directory.mkdir(parents=True, exist_ok=True)
 
         # Copy manifest (version becomes the filename, not a directory)
         dest_manifest = manifest_dir / version
@@ -190,22 +550,66 @@ def copy_files(model_name, manifest_path, digests):
 
         # Copy blobs
         print("\nCopying blobs...")
+        # Build paths as plain strings; this loop runs once per blob
+        src_dir, dst_dir = str(ollama_blob_dir()), str(blobs_dir)
+        pairs = []
+        seen = set()
         for digest in digests:
-            blob_file = OLLAMA_BLOB_DIR / digest.replace(":", "-")
-            if blob_file.exists():
-                dest_blob = blobs_dir / digest.replace(":", "-")
-                shutil.copy2(blob_file, dest_blob)
-                print(f"  ✓ {digest.replace(':', '-')}")
+            blob_name = digest.replace(":", "-")
+            # A digest listed twice must not get two jobs writing the same file
+            if blob_name in seen:
+                continue
+            seen.add(blob_name)
+            blob_file = os.path.join(src_dir, blob_name)
+            if blob_names is not None:
+                exists = blob_name in blob_names
             else:
-                print(f"  ✗ Skipped {digest.replace(':', '-')} (file not found)")
-
-        print(f"\n✓ Files copied successfully to {OUTPUT_DIR.absolute()}")
+                exists = os.path.exists(blob_file)
+            if exists:
+                dest_blob = os.path.join(dst_dir, blob_name)
+                # Blobs are content-addressed, so a same-sized file with this name is this blob
+                if _same_size(blob_file, dest_blob):
+                    print(f"  = {blob_name} (already present)")
+                    continue
+                pairs.append((blob_name, blob_file, dest_blob))
+            else:
+                print(f"  ✗ Skipped {blob_name} (file not found)")
+
+        # Blob copies are independent and I/O-bound, so overlap them
+        failed = 0
+        if pairs:
+            # Linking only makes sense within one filesystem
+            link = link and os.stat(src_dir).st_dev == os.stat(dst_dir).st_dev
+            with ThreadPoolExecutor(max_workers=min(MAX_COPY_WORKERS, len(pairs))) as pool:
+                futures = {pool.submit(_export_blob, src, dst, link): name for name, src, dst in pairs}
+                for future in as_completed(futures):
+                    try:
+                        future.result()
+                        print(f"  ✓ {futures[future]}")
+                    except Exception as e:  # one bad blob must not hide the others' results
+                        failed += 1
+                        print(f"  ✗ Failed {futures[future]} ({e})")
+
+        if failed:
+            print(f"\n✗ {failed} blob(s) failed to copy to {OUTPUT_DIR.absolute()}")
+        else:
+            print(f"\n✓ Files copied successfully to {OUTPUT_DIR.absolute()}")
 
     except Exception as e:
         print(f"\nError copying files: {e}")
 
 def main():
-    models = get_installed_models()
+    parser = argparse.ArgumentParser(description="Export Ollama models for backup or transfer.")
+    parser.add_argument("--no-link", action="store_true",
+                        help="always copy blob data instead of hardlinking/reflinking on the same filesystem")
+    parser.add_argument("--use-cli", action="store_true",
+                        help="list models with `ollama list` instead of reading the manifests directly")
+    args = parser.parse_args()
+
+    # Reading the manifests avoids starting `ollama` and works without the daemon
+    models = [] if args.use_cli else scan_local_models()
+    if not models:
+        models = get_installed_models()
     if not models:
         print("No models found. Try running `ollama pull <model>` first.")
         return
@@ -224,14 +628,15 @@ def main():
         print("No models selected.")
         return
 
-    # Collect all model data
-    model_data = []
-    for model in selected_models:
-        manifest_path = find_manifest_path(model)
-        digests = parse_manifest(manifest_path)
-        model_data.append((model, manifest_path, digests))
+    # Collect all model data; manifest reads are independent, so overlap them
+    with ThreadPoolExecutor(max_workers=min(MAX_MANIFEST_WORKERS, len(selected_models))) as pool:
+        model_data = list(pool.map(load_model, selected_models))
+
+    # List the blobs directory once; the preview and the copy both use this
+    blob_names = list_blob_names()
 
     # Display all paths
+    blob_dir = ollama_blob_dir()
     print("\n--- Manifest and Blob Paths ---")
     for model, manifest_path, digests in model_data:
         print(f"\nModel: {model}")
@@ -239,16 +644,19 @@ def main():
         print("Blobs:")
         for digest in digests:
             # Replace colon with dash for actual filename
-            blob_file = OLLAMA_BLOB_DIR / digest.replace(":", "-")
+            blob_name = digest.replace(":", "-")
+            blob_file = blob_dir / blob_name
             print(f"  {blob_file}")
-            if not blob_file.exists():
+            if blob_name not in blob_names:
                 print(f"    ⚠️  Warning: blob file missing ({blob_file})")
 
     # Ask if user wants to copy files
     if prompt_copy():
+        dirs_created = make_output_dirs(model for model, _, _ in model_data)
         for model, manifest_path, digests in model_data:
             print(f"\n--- Copying {model} ---")
-            copy_files(model, manifest_path, digests)
+            copy_files(model, manifest_path, digests, blob_names, link=not args.no_link,
+                       dirs_created=dirs_created)
 
 if __name__ == "__main__":
     main()
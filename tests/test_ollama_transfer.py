@@ -0,0 +1,147 @@
+import contextlib
+import hashlib
+import io
+import json
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import ollama_transfer
+
+
+class ExportBlobTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = Path(tmp.name)
+        self.base = self.root / "base"
+        (self.base / "blobs").mkdir(parents=True)
+        self.src = self.base / "blobs" / "sha256-aaa"
+        self.data = os.urandom(100_000)
+        self.src.write_bytes(self.data)
+        self.manifest = self.root / "manifest"
+        self.manifest.write_text("{}")
+        self.out = self.root / "out"
+
+        patches = [
+            mock.patch.object(ollama_transfer, "_resolve_ollama_base_dir", lambda: self.base),
+            mock.patch.object(ollama_transfer, "OUTPUT_DIR", self.out),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+        redirect = contextlib.redirect_stdout(io.StringIO())
+        redirect.__enter__()
+        self.addCleanup(redirect.__exit__, None, None, None)
+
+    def copy(self, digests, link):
+        ollama_transfer.copy_files("m:latest", self.manifest, digests, {"sha256-aaa"}, link=link)
+
+    def test_repeated_digest_keeps_source_blob(self):
+        self.copy(["sha256:aaa", "sha256:aaa"], link=True)
+        self.assertEqual(self.src.read_bytes(), self.data)
+        self.assertEqual((self.out / "blobs" / "sha256-aaa").read_bytes(), self.data)
+
+    def test_existing_hardlink_keeps_source_blob(self):
+        dst = self.out / "blobs" / "sha256-aaa"
+        dst.parent.mkdir(parents=True)
+        os.link(self.src, dst)
+        for link in (True, False):
+            ollama_transfer._export_blob(str(self.src), str(dst), link)
+            self.assertEqual(self.src.stat().st_size, len(self.data))
+            self.assertEqual(dst.read_bytes(), self.data)
+
+    def test_stale_destination_is_replaced(self):
+        dst = self.out / "blobs" / "sha256-aaa"
+        dst.parent.mkdir(parents=True)
+        dst.write_bytes(b"partial")
+        for link in (True, False):
+            ollama_transfer._export_blob(str(self.src), str(dst), link)
+            self.assertEqual(self.src.read_bytes(), self.data)
+            self.assertEqual(dst.read_bytes(), self.data)
+        self.assertEqual(os.listdir(dst.parent), ["sha256-aaa"])
+
+
+class ScanLocalModelsTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.base = Path(tmp.name)
+        self.library = self.base / "manifests" / "registry.ollama.ai" / "library"
+        patch = mock.patch.object(ollama_transfer, "_resolve_ollama_base_dir", lambda: self.base)
+        patch.start()
+        self.addCleanup(patch.stop)
+
+    def write_manifest(self, model, version, data):
+        path = self.library / model / version
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+        return path
+
+    def test_row_matches_ollama_list(self):
+        data = json.dumps({
+            "config": {"digest": "sha256:c", "size": 500_000_000},
+            "layers": [{"digest": "sha256:l1", "size": 4_000_000_000},
+                       {"digest": "sha256:l2", "size": 200_000_000}],
+        }).encode()
+        path = self.write_manifest("llama3", "8b", data)
+        hour_ago = path.stat().st_mtime - 3600
+        os.utime(path, (hour_ago, hour_ago))
+
+        with mock.patch.object(ollama_transfer.time, "time", return_value=hour_ago + 3600):
+            models = ollama_transfer.scan_local_models()
+
+        self.assertEqual(models, [["llama3:8b", hashlib.sha256(data).hexdigest()[:12],
+                                   "4.7 GB", "About an hour ago"]])
+
+    def test_invalid_and_unreadable_manifests_are_skipped(self):
+        self.write_manifest("good", "latest", b'{"layers": [{"size": 2048}]}')
+        self.write_manifest("bad", "latest", b"not json")
+        (self.library / "gone").mkdir()
+        os.symlink(self.library / "missing", self.library / "gone" / "latest")
+        (self.library / "stray-file").write_bytes(b"{}")
+
+        names = [model[0] for model in ollama_transfer.scan_local_models()]
+
+        self.assertEqual(names, ["good:latest"])
+
+    def test_missing_manifest_dir_returns_nothing(self):
+        self.assertEqual(ollama_transfer.scan_local_models(), [])
+
+    def test_main_falls_back_to_cli_when_scan_finds_nothing(self):
+        cli_models = [["a:latest", "x", "1 GB", "now"]]
+        with mock.patch.object(ollama_transfer, "get_installed_models", return_value=cli_models) as cli, \
+                mock.patch.object(ollama_transfer, "choose_models_text", return_value=[]) as choose, \
+                mock.patch.object(ollama_transfer, "LISTPICK_AVAILABLE", False), \
+                mock.patch.object(sys, "argv", ["ollama_transfer.py"]), \
+                contextlib.redirect_stdout(io.StringIO()):
+            ollama_transfer.main()
+
+        cli.assert_called_once_with()
+        choose.assert_called_once_with(cli_models)
+
+
+class FormattingTest(unittest.TestCase):
+    def test_human_size(self):
+        cases = {500: "500 B", 1500: "1.5 KB", 274_000_000: "274 MB",
+                 4_700_000_000: "4.7 GB", 2_000_000_000: "2 GB", 12_345_678_901: "12 GB"}
+        for size, expected in cases.items():
+            self.assertEqual(ollama_transfer._human_size(size), expected)
+
+    def test_time_ago(self):
+        now = 1_000_000_000
+        cases = {0: "Less than a second ago", 30: "30 seconds ago", 90: "About a minute ago",
+                 600: "10 minutes ago", 3600: "About an hour ago", 5 * 3600: "5 hours ago",
+                 3 * 86400: "3 days ago", 20 * 86400: "2 weeks ago", 90 * 86400: "3 months ago",
+                 800 * 86400: "2 years ago"}
+        for age, expected in cases.items():
+            self.assertEqual(ollama_transfer._time_ago(now - age, now=now), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()